@@ -2,14 +2,6 @@
 Example usage of the CampaignManager.
 """
 
-import sys
-from pathlib import Path
-
-
-# Add backend/src to path so we can import vello package
-backend_src = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(backend_src))
-
 from vello.core import db
 from vello.email import get_email_provider
 from vello.services import CampaignManager
@@ -91,7 +83,7 @@ def example_create_and_run_campaign():
     print("\n✅ Campaign example completed!")
 
 
-if __name__ == "__main__":
+def main():
     try:
         example_create_and_run_campaign()
     except Exception as e:
@@ -99,3 +91,7 @@ if __name__ == "__main__":
         import traceback
 
         traceback.print_exc()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,90 +2,14 @@
 Example usage of the email service with dependency injection.
 """
 import sys
-from pathlib import Path
-
-# Add backend/src to path so we can import vello package
-backend_src = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(backend_src))
+from typing import Final
 
 from vello.core import config, db
 from vello.email import EmailProvider, get_email_provider
 
 
-def send_campaign_email(
-    provider: EmailProvider,
-    recipient_email: str,
-    subject: str,
-    body_text: str,
-    body_html: str = None
-):
-    """
-    Send a campaign email using the injected provider.
-
-    Args:
-        provider: Email provider instance (injected)
-        recipient_email: Recipient's email address
-        subject: Email subject
-        body_text: Plain text body
-        body_html: HTML body (optional)
-    """
-    result = provider.send_email(
-        to=recipient_email,
-        subject=subject,
-        body_text=body_text,
-        body_html=body_html
-    )
-
-    if result.success:
-        print(f"✓ Email sent to {recipient_email}")
-        print(f"  Message ID: {result.message_id}")
-    else:
-        print(f"✗ Failed to send email to {recipient_email}")
-        print(f"  Error: {result.error}")
-
-    return result
-
-
-if __name__ == "__main__":
-    print("Email Service Example")
-    print("=" * 50)
-
-    # Check if email is configured
-    if not config.EMAIL_HOST_USER or not config.EMAIL_HOST_PASSWORD:
-        print("\n⚠️  Email configuration not found!")
-        print("\nTo use this example, create a .env file in the backend/ directory with:")
-        print("  EMAIL_PROVIDER=smtp")
-        print("  EMAIL_HOST=smtp.gmail.com")
-        print("  EMAIL_PORT=587")
-        print("  EMAIL_HOST_USER=your-email@gmail.com")
-        print("  EMAIL_HOST_PASSWORD=your-app-password")
-        print("\nNote: For Gmail, you need to use an App Password, not your regular password.")
-        print("      See: https://support.google.com/accounts/answer/185833")
-        sys.exit(0)
-
-    try:
-        # Initialize database (creates vello.db if it doesn't exist)
-        db.init_db()
-        print("✓ Database initialized")
-
-        # Get the configured provider (dependency injection)
-        email_provider = get_email_provider()
-
-        # Validate configuration
-        if not email_provider.validate_config():
-            print("\n❌ Error: Email provider is not properly configured")
-            print("Please check your .env file settings.")
-            sys.exit(1)
-
-        print(f"\n✓ Email provider configured: {config.EMAIL_PROVIDER}")
-        print(f"✓ SMTP host: {config.EMAIL_HOST}:{config.EMAIL_PORT}")
-        print(f"✓ From email: {config.EMAIL_HOST_USER}")
-
-        # Send a test email
-        print("\nSending test email...")
-
-        # Personal message content
-        body_text = """Hey! 👋
+# Personal message content; constant, so built once at import
+BODY_TEXT: Final[str] = """Hey! 👋
 
 If you're seeing this, Vello is working to some extent! 🎉
 
@@ -107,7 +31,7 @@ This is a test email from the Vello email outreach system.
 Powered by Vello • Automation-First Email Outreach
 """
 
-        body_html = """<!DOCTYPE html>
+BODY_HTML: Final[str] = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -195,12 +119,85 @@ Powered by Vello • Automation-First Email Outreach
 </body>
 </html>"""
 
+
+def send_campaign_email(
+    provider: EmailProvider,
+    recipient_email: str,
+    subject: str,
+    body_text: str,
+    body_html: str = None
+):
+    """
+    Send a campaign email using the injected provider.
+
+    Args:
+        provider: Email provider instance (injected)
+        recipient_email: Recipient's email address
+        subject: Email subject
+        body_text: Plain text body
+        body_html: HTML body (optional)
+    """
+    result = provider.send_email(
+        to=recipient_email,
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html
+    )
+
+    if result.success:
+        print(f"✓ Email sent to {recipient_email}")
+        print(f"  Message ID: {result.message_id}")
+    else:
+        print(f"✗ Failed to send email to {recipient_email}")
+        print(f"  Error: {result.error}")
+
+    return result
+
+
+def main():
+    print("Email Service Example")
+    print("=" * 50)
+
+    # Check if email is configured
+    if not config.EMAIL_HOST_USER or not config.EMAIL_HOST_PASSWORD:
+        print("\n⚠️  Email configuration not found!")
+        print("\nTo use this example, create a .env file in the backend/ directory with:")
+        print("  EMAIL_PROVIDER=smtp")
+        print("  EMAIL_HOST=smtp.gmail.com")
+        print("  EMAIL_PORT=587")
+        print("  EMAIL_HOST_USER=your-email@gmail.com")
+        print("  EMAIL_HOST_PASSWORD=your-app-password")
+        print("\nNote: For Gmail, you need to use an App Password, not your regular password.")
+        print("      See: https://support.google.com/accounts/answer/185833")
+        sys.exit(0)
+
+    try:
+        # Initialize database (creates vello.db if it doesn't exist)
+        db.init_db()
+        print("✓ Database initialized")
+
+        # Get the configured provider (dependency injection)
+        email_provider = get_email_provider()
+
+        # Validate configuration
+        if not email_provider.validate_config():
+            print("\n❌ Error: Email provider is not properly configured")
+            print("Please check your .env file settings.")
+            sys.exit(1)
+
+        print(f"\n✓ Email provider configured: {config.EMAIL_PROVIDER}")
+        print(f"✓ SMTP host: {config.EMAIL_HOST}:{config.EMAIL_PORT}")
+        print(f"✓ From email: {config.EMAIL_HOST_USER}")
+
+        # Send a test email
+        print("\nSending test email...")
+
         result = send_campaign_email(
             provider=email_provider,
             recipient_email="ibrahim.albajjeh003@gmail.com",
             subject="🚀 Vello is Working! (Test from Sina)",
-            body_text=body_text,
-            body_html=body_html
+            body_text=BODY_TEXT,
+            body_html=BODY_HTML
         )
 
         if result.success:
@@ -225,3 +222,7 @@ Powered by Vello • Automation-First Email Outreach
     print("  EMAIL_PROVIDER=smtp      # Use SMTP (Gmail, etc.)")
     print("  EMAIL_PROVIDER=sendgrid  # Use SendGrid (when implemented)")
     print("  EMAIL_PROVIDER=ses       # Use AWS SES (when implemented)")
+
+
+if __name__ == "__main__":
+    main()
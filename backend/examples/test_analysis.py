@@ -1,10 +1,3 @@
-import sys
-from pathlib import Path
-
-# Add backend/src to path so we can import vello package
-backend_src = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(backend_src))
-
 from vello.core.models import ResponseStatus
 from vello.services import analyze_intent
 
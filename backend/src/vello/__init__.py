@@ -1,17 +1,40 @@
 """
 Vello - Automation-First Email Outreach System
 Main package initialization.
+
+Public names are imported lazily on first access (PEP 562), so importing
+one subpackage (e.g. vello.utils) doesn't pull in SQLAlchemy or SMTP code.
 """
-from vello.core import config, db, models
-from vello.email import EmailProvider, EmailResult, get_email_provider
-from vello.services import CampaignManager, analyze_intent
-from vello.utils import TemplateLoader, get_template_loader
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING, Any as _Any
+
+if _TYPE_CHECKING:
+    from vello.core import config, db, models
+    from vello.email import EmailProvider, EmailResult, get_email_provider
+    from vello.services import CampaignManager, analyze_intent, analyze_intent_batch
+    from vello.utils import TemplateLoader, get_template_loader
+
+# Public name -> module that provides it
+_LAZY_IMPORTS = {
+    'models': 'vello.core',
+    'db': 'vello.core',
+    'config': 'vello.core',
+    'analyze_intent': 'vello.services',
+    'analyze_intent_batch': 'vello.services',
+    'CampaignManager': 'vello.services',
+    'get_template_loader': 'vello.utils',
+    'TemplateLoader': 'vello.utils',
+    'get_email_provider': 'vello.email',
+    'EmailProvider': 'vello.email',
+    'EmailResult': 'vello.email',
+}
 
 __all__ = [
     'models',
     'db',
     'config',
     'analyze_intent',
+    'analyze_intent_batch',
     'CampaignManager',
     'get_template_loader',
     'TemplateLoader',
@@ -19,3 +42,18 @@ __all__ = [
     'EmailProvider',
     'EmailResult',
 ]
+
+
+def __getattr__(name: str) -> _Any:
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_importlib.import_module(module_path), name)
+    # Cache so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
@@ -1,65 +1,137 @@
+import csv
+import itertools
 import os
 import re
-from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 
 from vello.core.db import get_db, init_db
 from vello.core.models import Recipient
 
+try:
+    # Optional: google-re2 matches in linear time (pip install google-re2)
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+EMAIL_RE = _regex.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+")
+
+# Max emails per IN (...) lookup; keeps well under SQLite's variable limit
+CHUNK_SIZE = 500
+
+# Dialects supporting INSERT ... ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+
+def _chunks(iterable, size=CHUNK_SIZE):
+    """Yield lists of up to `size` items from any iterable."""
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def _existing_emails(db, campaign_id, emails):
+    """Return which of `emails` are already recipients of the campaign."""
+    existing = set()
+    for chunk in _chunks(emails):
+        query = select(Recipient.email).where(
+            Recipient.campaign_id == campaign_id,
+            Recipient.email.in_(chunk),
+        )
+        existing.update(db.execute(query).scalars())
+    return existing
+
+
+def _iter_valid_emails(file):
+    """Yield valid emails from the first CSV column, one row at a time."""
+    # Assume email is the first column (or the whole line)
+    for row in csv.reader(file):
+        if not row:
+            continue
+
+        email = row[0].strip()
+        if not email:
+            continue
+
+        if EMAIL_RE.fullmatch(email):
+            yield email
+        else:
+            print(f"Skipping invalid email: {email}")
+
+
+def _insert_new_recipients(db, campaign_id, emails):
+    """Insert the emails not already in the campaign; returns the count added."""
+    rows = [
+        {
+            "campaign_id": campaign_id,
+            "email": email,
+            "suppressed": False,
+        }
+        for email in emails
+    ]
+
+    insert = _CONFLICT_INSERTS.get(db.get_bind().dialect.name)
+    if insert is not None:
+        # Let uq_campaign_recipient_email reject duplicates in the same
+        # statement instead of looking them up first. Count the returned ids,
+        # since executemany rowcount is not reliable on every driver (psycopg2)
+        stmt = (
+            insert(Recipient.__table__)
+            .on_conflict_do_nothing(index_elements=["campaign_id", "email"])
+            .returning(Recipient.__table__.c.id)
+        )
+        return len(db.execute(stmt, rows).all())
+
+    # Other dialects: filter out existing emails, then bulk insert
+    existing = _existing_emails(db, campaign_id, emails)
+    new_rows = []
+    for row in rows:
+        if row["email"] in existing:
+            continue
+        # Guard against the same email appearing twice in one chunk; repeats
+        # across chunks are caught by the lookup, which sees earlier inserts
+        existing.add(row["email"])
+        new_rows.append(row)
+
+    if new_rows:
+        db.bulk_insert_mappings(Recipient, new_rows)
+    return len(new_rows)
+
 
 def add_leads(csv_path, campaign_id):
     # Ensure DB is initialized
     init_db()
 
-    check_email_regex = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
-    valid_emails = []
-
     print(f"Reading leads from {csv_path}...")
 
     try:
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            # Check if file has header, if so use csv.DictReader, else assume single column
-            # For now, following user's simple line-by-line approach but safer
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-
-                # Simple CSV handling: assume email is the first thing or the whole line
-                parts = line.split(',')
-                email = parts[0].strip()
-
-                if re.match(check_email_regex, email):
-                    valid_emails.append(email)
-                else:
-                    print(f"Skipping invalid email: {email}")
+        file = open(csv_path, 'r', encoding='utf-8', newline='')
     except FileNotFoundError:
         print(f"Error: File '{csv_path}' not found.")
         return
 
-    if not valid_emails:
-        print("No valid emails found.")
-        return
-
     db = next(get_db())
     try:
-        count = 0
-        for email in valid_emails:
-            # Check if already exists in this campaign to avoid unique constraint error
-            existing = db.query(Recipient).filter_by(campaign_id=campaign_id, email=email).first()
-            if existing:
-                print(f"Skipping duplicate: {email}")
-                continue
-
-            recipient = Recipient(
-                campaign_id=campaign_id,
-                email=email,
-                suppressed=False,
-                created_at=datetime.utcnow()
-            )
-            db.add(recipient)
-            count += 1
+        with file:
+            # Stream the file in CHUNK_SIZE batches so memory stays bounded
+            # regardless of file size; everything commits once at the end.
+            # created_at is filled in by the database's server default.
+            found = count = 0
+            for chunk in _chunks(_iter_valid_emails(file)):
+                found += len(chunk)
+                count += _insert_new_recipients(db, campaign_id, chunk)
+
+        if not found:
+            print("No valid emails found.")
+            return
 
         db.commit()
+        if found > count:
+            print(f"Skipped {found - count} duplicate emails")
         print(f"Successfully added {count} recipients to campaign {campaign_id}")
 
     except Exception as e:
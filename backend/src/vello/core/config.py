@@ -1,28 +1,38 @@
+import functools
 import json
 import os
+from pathlib import Path
 from typing import Any, Dict
 
 from dotenv import load_dotenv
 
+try:
+    # Optional: faster JSON parsing (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
 # Get backend directory (config.py is at backend/src/vello/core/config.py)
-_backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-_config_dir = os.path.join(_backend_dir, "config")
+_backend_dir = Path(__file__).resolve().parents[3]
+_config_dir = _backend_dir / "config"
 
 # Database settings
 # Default to vello.db in the backend directory
-_default_db_path = os.path.join(_backend_dir, "vello.db")
+_default_db_path = _backend_dir / "vello.db"
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{_default_db_path}")
 
 # Email settings
-EMAIL_PROVIDER = os.getenv("EMAIL_PROVIDER", "smtp")  # smtp, sendgrid, ses
+EMAIL_PROVIDER = os.getenv("EMAIL_PROVIDER", "smtp")  # smtp, async_smtp, sendgrid, ses
 EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", 587))
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() in ("true", "1", "t")
+# Max concurrent sends per batch
+SMTP_CONCURRENCY = int(os.getenv("SMTP_CONCURRENCY", 1))
 
 # Provider-specific settings (for future use)
 SENDGRID_API_KEY = os.getenv("SENDGRID_API_KEY")
@@ -34,10 +44,13 @@ DEBUG = os.getenv("DEBUG", "False").lower() in ("true", "1", "t")
 IN_MEMORY_DB = os.getenv("IN_MEMORY_DB", "False").lower() in ("true", "1", "t")
 
 # Configuration file loader (must be defined before use)
+@functools.lru_cache(maxsize=None)
 def load_config_file(filename: str) -> Dict[str, Any]:
     """
     Load a JSON configuration file from the config directory.
     Returns empty dict if file doesn't exist.
+    Results are cached per filename; treat the returned dict as read-only
+    and call load_config_file.cache_clear() to pick up file changes.
 
     Args:
         filename: Name of the config file (e.g., "warmup.json")
@@ -45,11 +58,13 @@ def load_config_file(filename: str) -> Dict[str, Any]:
     Returns:
         Dictionary with config values
     """
-    config_path = os.path.join(_config_dir, filename)
-    if os.path.exists(config_path):
+    config_path = _config_dir / filename
+    if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            data = config_path.read_bytes()
+            if orjson is not None:
+                return orjson.loads(data)
+            return json.loads(data)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load config file {filename}: {e}")
             return {}
@@ -1,8 +1,23 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from vello.core.models import Base
+from sqlalchemy import create_engine, event, func, select, update
+from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.pool import StaticPool
+from vello.core.models import (
+    Base,
+    Campaign,
+    Delivery,
+    DeliveryStatus,
+    Recipient,
+    Response,
+    ResponseStatus,
+)
 from vello.core import config
 
+try:
+    # Optional: faster JSON encoding for JSON columns (pip install orjson)
+    import orjson
+except ImportError:
+    orjson = None
+
 # Determine database URL based on config
 if config.IN_MEMORY_DB:
     DATABASE_URL = "sqlite:///:memory:"
@@ -11,12 +26,89 @@ else:
     DATABASE_URL = config.DATABASE_URL
     echo_sql = config.DEBUG
 
-engine = create_engine(DATABASE_URL, echo=echo_sql)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Connection pool settings
+if config.IN_MEMORY_DB:
+    # One shared connection, otherwise each checkout sees an empty database
+    engine_options = {
+        "poolclass": StaticPool,
+        "connect_args": {"check_same_thread": False},
+    }
+else:
+    # Ping on checkout so long-idle workers never hit a dead connection,
+    # and keep overflow small so pool_size actually bounds concurrency
+    engine_options = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if DATABASE_URL.startswith("sqlite"):
+        engine_options["connect_args"] = {"check_same_thread": False}
+
+if orjson is not None:
+    # orjson.dumps returns bytes; drivers expect str
+    engine_options["json_serializer"] = lambda obj: orjson.dumps(obj).decode()
+    engine_options["json_deserializer"] = orjson.loads
+
+engine = create_engine(DATABASE_URL, echo=echo_sql, **engine_options)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _):
+        """Use WAL with relaxed fsyncs so commits don't block readers."""
+        cursor = dbapi_conn.cursor()
+        for pragma in (
+            "journal_mode=WAL",
+            "synchronous=NORMAL",
+            "temp_store=MEMORY",
+            "mmap_size=268435456",
+            "cache_size=-65536",
+            "busy_timeout=5000",
+        ):
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+# Thread-local registry: each worker thread reuses its own session
+SessionLocal = scoped_session(
+    sessionmaker(autocommit=False, autoflush=False, bind=engine)
+)
 
 def init_db():
-    """Initialize the database tables."""
+    """Initialize the database tables and bring the campaign counters up to date."""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(recompute_campaign_counters())
+
+def recompute_campaign_counters(campaign_id=None):
+    """
+    Build an UPDATE that rewrites Campaign.sent_count, failed_count and
+    positive_count from the delivery and response rows.
+
+    The counters are only maintained by CampaignManager; run this after
+    changing delivery/response statuses or deleting rows any other way.
+
+    Args:
+        campaign_id: Campaign to recompute (None = every campaign)
+
+    Returns:
+        UPDATE statement to execute
+    """
+    def count(model, status):
+        return (
+            select(func.count(model.id))
+            .join(Recipient, model.recipient_id == Recipient.id)
+            .where(Recipient.campaign_id == Campaign.id, model.status == status)
+            .scalar_subquery()
+        )
+
+    stmt = update(Campaign).values(
+        sent_count=count(Delivery, DeliveryStatus.SENT),
+        failed_count=count(Delivery, DeliveryStatus.FAILED),
+        positive_count=count(Response, ResponseStatus.POSITIVE),
+    )
+    if campaign_id is not None:
+        stmt = stmt.where(Campaign.id == campaign_id)
+    return stmt
 
 def get_db():
     """Dependency for getting a database session."""
@@ -24,5 +116,4 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
-
+        SessionLocal.remove()
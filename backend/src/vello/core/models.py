@@ -1,6 +1,5 @@
 # models.py
 import enum
-from datetime import datetime
 
 from sqlalchemy import (
     Boolean,
@@ -8,16 +7,43 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
+    JSON,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import declarative_base, deferred, relationship
+from sqlalchemy.sql.expression import FunctionElement
 
 Base = declarative_base()
 
 
+class utc_now(FunctionElement):
+    """
+    Current UTC time, computed by the database.
+    Used for timestamp defaults so inserts don't bind a Python-side value
+    per row; naive UTC to match the datetime.utcnow() values the app compares.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_now)
+def _utc_now_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_now, "postgresql")
+def _utc_now_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
 class DeliveryStatus(enum.Enum):
     PENDING = "pending"
     SENT = "sent"
@@ -36,13 +62,38 @@ class ResponseStatus(enum.Enum):
     FAILED = "failed"
 
 
+def _status_enum(enum_cls, name):
+    """
+    Store a status enum as its lowercase value in a VARCHAR(16) with a CHECK
+    constraint, rather than a native database ENUM type, so adding a status
+    needs no type migration.
+    """
+    return Enum(
+        enum_cls,
+        name=name,
+        native_enum=False,
+        create_constraint=True,
+        length=16,
+        values_callable=lambda statuses: [status.value for status in statuses],
+    )
+
+
 class Campaign(Base):
     __tablename__ = "campaign"
     id = Column(Integer, primary_key=True)
     name = Column(String(200), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+
+    # Denormalized counters so dashboards read one row instead of
+    # aggregating deliveries/responses. Only CampaignManager maintains them;
+    # db.recompute_campaign_counters() rebuilds them from the rows
+    sent_count = Column(Integer, nullable=False, server_default="0")
+    failed_count = Column(Integer, nullable=False, server_default="0")
+    positive_count = Column(Integer, nullable=False, server_default="0")
 
     # Relationships
+    # All relationships load lazily; queries that walk them opt in with
+    # selectinload() so single-row lookups don't pull in related rows
     steps = relationship(
         "CampaignStep",
         back_populates="campaign",
@@ -61,8 +112,9 @@ class CampaignStep(Base):
     position = Column(Integer, nullable=False)  # 0,1,2,...
     delay_minutes = Column(Integer, nullable=False, default=0)
     subject = Column(Text, nullable=False)
-    body_text = Column(Text, nullable=True)
-    body_html = Column(Text, nullable=True)
+    # Large; only loaded when a step is rendered (undefer_group("bodies"))
+    body_text = deferred(Column(Text, nullable=True), group="bodies")
+    body_html = deferred(Column(Text, nullable=True), group="bodies")
 
     campaign = relationship("Campaign", back_populates="steps")
     deliveries = relationship(
@@ -75,12 +127,17 @@ class CampaignStep(Base):
 class Recipient(Base):
     __tablename__ = "recipient"
     id = Column(Integer, primary_key=True)
-    campaign_id = Column(Integer, ForeignKey("campaign.id"), nullable=False, index=True)
+    # Indexed by ix_recipients_campaign_suppressed (campaign_id is its leading column)
+    campaign_id = Column(Integer, ForeignKey("campaign.id"), nullable=False)
     email = Column(String(320), nullable=False, index=True)
     name = Column(String(200), nullable=True)
-    vars_json = Column(Text, nullable=True)  # raw JSON string of CSV row
+    # Template variables from the CSV row; SQL NULL when there are none
+    vars_json = Column(
+        JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), "postgresql"),
+        nullable=True,
+    )
     suppressed = Column(Boolean, nullable=False, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     campaign = relationship("Campaign", back_populates="recipients")
     deliveries = relationship(
@@ -90,35 +147,60 @@ class Recipient(Base):
     # Prevent same email in same campaign
     __table_args__ = (
         UniqueConstraint("campaign_id", "email", name="uq_campaign_recipient_email"),
+        # Active (unsuppressed) recipients of a campaign
+        Index("ix_recipients_campaign_suppressed", "campaign_id", "suppressed"),
     )
 
+    @property
+    def display_name(self) -> str:
+        """Name to greet the recipient by: name, else the email's local part."""
+        return self.name or self.email.partition("@")[0]
+
 
 class Delivery(Base):
     __tablename__ = "delivery"
     id = Column(Integer, primary_key=True)
     # Link to specific step ID for safety, not just position
-    step_id = Column(
-        Integer, ForeignKey("campaign_step.id"), nullable=False, index=True
-    )
-    recipient_id = Column(
-        Integer, ForeignKey("recipient.id"), nullable=False, index=True
-    )
+    # Indexed by ix_delivery_step_status (step_id is its leading column)
+    step_id = Column(Integer, ForeignKey("campaign_step.id"), nullable=False)
+    # Indexed by uq_recipient_step (recipient_id is its leading column)
+    recipient_id = Column(Integer, ForeignKey("recipient.id"), nullable=False)
 
     status = Column(
-        Enum(DeliveryStatus), nullable=False, default=DeliveryStatus.PENDING
+        _status_enum(DeliveryStatus, "ck_delivery_status"),
+        nullable=False,
+        default=DeliveryStatus.PENDING,
     )
     last_error = Column(Text, nullable=True)
     sent_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     message_id = Column(String(255), nullable=True)
 
     step = relationship("CampaignStep", back_populates="deliveries")
     recipient = relationship("Recipient", back_populates="deliveries")
 
-    # Ensure one delivery record per recipient per step
     __table_args__ = (
+        # Ensure one delivery record per recipient per step; also serves
+        # (recipient_id, step_id) lookups
         UniqueConstraint("recipient_id", "step_id", name="uq_recipient_step"),
+        # Deliveries by status for a set of recipients; on PostgreSQL the
+        # included columns make it covering for the readiness checks
+        Index(
+            "ix_delivery_status_recipient",
+            "status",
+            "recipient_id",
+            postgresql_include=["step_id", "sent_at"],
+        ),
+        # Pending deliveries for a step, and the oldest pending deliveries
+        # overall; on PostgreSQL the latter only covers pending rows
+        Index("ix_delivery_step_status", "step_id", "status"),
+        Index(
+            "ix_delivery_status_created_at",
+            "status",
+            "created_at",
+            postgresql_where=(status == DeliveryStatus.PENDING),
+        ),
     )
 
 
@@ -132,9 +214,11 @@ class Response(Base):
 
     content = Column(Text, nullable=False)
     status = Column(
-        Enum(ResponseStatus), nullable=False, default=ResponseStatus.PENDING
+        _status_enum(ResponseStatus, "ck_response_status"),
+        nullable=False,
+        default=ResponseStatus.PENDING,
     )
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
 
     recipient = relationship("Recipient")
     delivery = relationship("Delivery")
@@ -154,8 +238,8 @@ class Lead(Base):
     state = Column(String(200), nullable=True)
     zip = Column(String(200), nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utc_now())
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now())
     __table_args__ = (UniqueConstraint("email", name="uq_lead_email"),)
 
 
@@ -190,4 +274,11 @@ class OutboundMailbox(Base):
 
     __table_args__ = (
         UniqueConstraint("email_address", name="uq_outbound_mailbox_email_address"),
+        # Sender rotation picks the least recently used enabled mailbox
+        Index(
+            "ix_mailbox_active",
+            "last_used_at",
+            postgresql_where=text("disabled = false"),
+            sqlite_where=text("disabled = 0"),
+        ),
     )
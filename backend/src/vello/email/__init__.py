@@ -3,6 +3,6 @@ Email service package.
 Provides email sending functionality with pluggable providers.
 """
 from vello.email.base import EmailProvider, EmailResult
-from vello.email.factory import get_email_provider
+from vello.email.factory import get_email_provider, reset_email_provider
 
-__all__ = ['get_email_provider', 'EmailProvider', 'EmailResult']
+__all__ = ['get_email_provider', 'reset_email_provider', 'EmailProvider', 'EmailResult']
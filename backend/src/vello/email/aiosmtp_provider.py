@@ -0,0 +1,268 @@
+"""
+Async SMTP email provider built on aiosmtplib.
+Pipelines sends over a pool of connections so a slow server doesn't stall
+a whole batch.
+To use: pip install aiosmtplib
+"""
+import asyncio
+import threading
+import weakref
+from email.utils import make_msgid
+from typing import Any, Dict, List, Optional, Tuple
+
+from vello.core import config
+from vello.email.base import EmailResult
+from vello.email.smtp_provider import build_message
+
+
+class _LoopPool:
+    """Connected clients and the concurrency limit for one event loop."""
+
+    def __init__(self, max_connections: int):
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.idle: List[Any] = []
+
+
+class AiosmtpProvider:
+    """
+    Async SMTP email provider.
+    Implements EmailProvider protocol without inheritance; send_email() is a
+    blocking wrapper around asend_email() for synchronous callers.
+
+    Up to max_connections logged-in clients are kept per event loop and
+    shared by concurrent sends. Call aclose() before the loop ends to log
+    them out.
+
+    send_email() runs every send on one event loop in a background thread,
+    so it may be called from several threads at once (and from code that is
+    itself running an event loop) while reusing the same connections. Call
+    close() to log them out and stop the thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool = True,
+        default_from: Optional[str] = None,
+        max_connections: int = 10
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.default_from = default_from or username
+        self.max_connections = max_connections
+        # Clients can't be shared between loops, so each loop gets its own
+        self._pools: "weakref.WeakKeyDictionary[Any, _LoopPool]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+        # Background loop for send_email(): (loop, thread, finalizer stopping it)
+        self._runner: Optional[Tuple[Any, threading.Thread, weakref.finalize]] = None
+
+    def _pool(self) -> _LoopPool:
+        """Get the running loop's pool, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                pool = self._pools[loop] = _LoopPool(self.max_connections)
+        return pool
+
+    def _client(self):
+        """Create an unconnected client (STARTTLS or implicit TLS, per config)."""
+        import aiosmtplib
+
+        return aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            use_tls=not self.use_tls,
+            start_tls=self.use_tls,
+        )
+
+    async def _acquire(self, pool: _LoopPool, fresh: bool = False):
+        """Take an idle connected client, or connect a new one."""
+        while pool.idle and not fresh:
+            client = pool.idle.pop()
+            if client.is_connected:
+                return client
+        client = self._client()
+        await client.connect()
+        return client
+
+    async def asend_batch(self, messages: List[Dict[str, Any]]) -> List[EmailResult]:
+        """
+        Send several emails concurrently over the pooled connections.
+
+        Args:
+            messages: List of send_email() keyword-argument dicts
+
+        Returns:
+            One EmailResult per message, in order
+        """
+        return list(
+            await asyncio.gather(*(self.asend_email(**message) for message in messages))
+        )
+
+    async def _send_one(
+        self,
+        client,
+        to: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+        from_email: Optional[str] = None,
+        **kwargs
+    ) -> EmailResult:
+        """Send one email on an already-connected client."""
+        message_id = make_msgid(domain=self.host)
+        msg = build_message(
+            to=to,
+            subject=subject,
+            body_text=body_text,
+            body_html=body_html,
+            from_email=from_email or self.default_from,
+            message_id=message_id
+        )
+        await client.send_message(msg)
+
+        return EmailResult(success=True, message_id=message_id)
+
+    async def asend_email(
+        self,
+        to: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+        from_email: Optional[str] = None,
+        **kwargs
+    ) -> EmailResult:
+        """
+        Send email via SMTP without blocking the event loop.
+        A pooled connection the server has dropped is replaced once and the
+        send retried.
+        """
+        import aiosmtplib
+
+        pool = self._pool()
+        async with pool.semaphore:
+            for attempt in range(2):
+                try:
+                    client = await self._acquire(pool, fresh=attempt > 0)
+                except Exception as e:
+                    return EmailResult(success=False, error=str(e))
+
+                try:
+                    result = await self._send_one(
+                        client,
+                        to=to,
+                        subject=subject,
+                        body_text=body_text,
+                        body_html=body_html,
+                        from_email=from_email,
+                        **kwargs
+                    )
+                except aiosmtplib.SMTPServerDisconnected as e:
+                    client.close()
+                    if attempt:
+                        return EmailResult(success=False, error=str(e))
+                    continue
+                except Exception as e:
+                    client.close()
+                    return EmailResult(success=False, error=str(e))
+
+                pool.idle.append(client)
+                return result
+
+    async def aclose(self) -> None:
+        """Log out all idle connections on the running loop."""
+        pool = self._pool()
+        idle, pool.idle = pool.idle, []
+        for client in idle:
+            try:
+                await client.quit()
+            except Exception:
+                client.close()
+
+    def send_email(
+        self,
+        to: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+        from_email: Optional[str] = None,
+        **kwargs
+    ) -> EmailResult:
+        """Send email via SMTP, blocking until it completes."""
+        return self._run(
+            self.asend_email(
+                to=to,
+                subject=subject,
+                body_text=body_text,
+                body_html=body_html,
+                from_email=from_email,
+                **kwargs
+            )
+        )
+
+    def _run(self, coro):
+        """Run a coroutine on the background loop, starting it on first use."""
+        with self._lock:
+            if self._runner is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="vello-aiosmtp", daemon=True
+                )
+                thread.start()
+                # Stop the thread if the provider is dropped without close()
+                stop = weakref.finalize(self, loop.call_soon_threadsafe, loop.stop)
+                self._runner = (loop, thread, stop)
+            loop = self._runner[0]
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    def close(self) -> None:
+        """Log out the background loop's connections and stop its thread."""
+        with self._lock:
+            runner, self._runner = self._runner, None
+        if runner is None:
+            return
+        loop, thread, stop = runner
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+        finally:
+            stop()
+            thread.join()
+            loop.close()
+
+    def __enter__(self) -> "AiosmtpProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def validate_config(self) -> bool:
+        """Validate SMTP configuration."""
+        return all([
+            self.host,
+            self.port,
+            self.username,
+            self.password
+        ])
+
+
+def create_aiosmtp_provider() -> AiosmtpProvider:
+    """Factory function to create async SMTP provider from config."""
+    return AiosmtpProvider(
+        host=config.EMAIL_HOST,
+        port=config.EMAIL_PORT,
+        username=config.EMAIL_HOST_USER,
+        password=config.EMAIL_HOST_PASSWORD,
+        use_tls=config.EMAIL_USE_TLS,
+        default_from=config.EMAIL_HOST_USER
+    )
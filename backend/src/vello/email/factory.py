@@ -1,6 +1,7 @@
 """
 Email provider factory using dependency injection.
 """
+import functools
 from typing import TYPE_CHECKING
 
 from vello.core import config
@@ -9,10 +10,13 @@ if TYPE_CHECKING:
     from vello.email.base import EmailProvider
 
 
+@functools.lru_cache(maxsize=1)
 def get_email_provider() -> "EmailProvider":
     """
     Factory function to get the configured email provider.
     Uses dependency injection - returns a provider instance based on config.
+    The instance is created once and shared, so pooled connections are
+    reused across callers; call reset_email_provider() after changing config.
 
     Returns:
         An instance implementing the EmailProvider protocol
@@ -23,6 +27,10 @@ def get_email_provider() -> "EmailProvider":
         from vello.email.smtp_provider import create_smtp_provider
         return create_smtp_provider()
 
+    elif provider_name == "async_smtp":
+        from vello.email.aiosmtp_provider import create_aiosmtp_provider
+        return create_aiosmtp_provider()
+
     elif provider_name == "sendgrid":
         # Future implementation
         raise NotImplementedError("SendGrid provider not yet implemented")
@@ -35,6 +43,15 @@ def get_email_provider() -> "EmailProvider":
         raise ValueError(f"Unknown email provider: {provider_name}")
 
 
+def reset_email_provider() -> None:
+    """Close and forget the shared provider so the next call rebuilds it."""
+    if get_email_provider.cache_info().currsize:
+        close = getattr(get_email_provider(), "close", None)
+        if close is not None:
+            close()
+    get_email_provider.cache_clear()
+
+
 # Example of how to use with dependency injection:
 #
 # def send_campaign_email(provider: EmailProvider, recipient: str, subject: str, body: str):
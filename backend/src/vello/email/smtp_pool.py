@@ -0,0 +1,252 @@
+"""
+Pool of persistent SMTP connections.
+Reuses authenticated sessions so consecutive sends skip the
+TCP + TLS + AUTH handshake.
+"""
+import queue
+import smtplib
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from email.message import Message
+from typing import Iterator, Optional, Tuple
+
+
+def _quit(conn: smtplib.SMTP) -> None:
+    """Close a connection, ignoring errors from already-dead sockets."""
+    try:
+        conn.quit()
+    except (smtplib.SMTPException, OSError):
+        conn.close()
+
+
+def _drain(idle: "queue.Queue[Tuple[smtplib.SMTP, float]]") -> None:
+    """Close every idle connection in the queue."""
+    while True:
+        try:
+            conn, _ = idle.get_nowait()
+        except queue.Empty:
+            return
+        _quit(conn)
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of logged-in SMTP connections for one server/account.
+
+    Connections are opened on demand up to pool_size and recycled after
+    max_messages_per_conn messages. A connection idle for more than
+    noop_after seconds is checked with NOOP before reuse. Idle connections
+    are closed when the pool is closed, garbage collected, or at interpreter
+    exit.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool = True,
+        pool_size: int = 5,
+        max_messages_per_conn: int = 100,
+        noop_after: float = 30.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.pool_size = pool_size
+        self.max_messages_per_conn = max_messages_per_conn
+        self.noop_after = noop_after
+
+        # Idle connections with the time they were returned
+        self._idle: "queue.Queue[Tuple[smtplib.SMTP, float]]" = queue.Queue()
+        self._sent_counts: "weakref.WeakKeyDictionary[smtplib.SMTP, int]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._open = 0
+        self._lock = threading.Lock()
+        # Signalled whenever a connection is returned or a slot is freed
+        self._available = threading.Condition(self._lock)
+        weakref.finalize(self, _drain, self._idle)
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open and authenticate a new SMTP connection."""
+        if self.use_tls:
+            conn = smtplib.SMTP(self.host, self.port)
+            conn.starttls()
+        else:
+            conn = smtplib.SMTP_SSL(self.host, self.port)
+
+        try:
+            conn.login(self.username, self.password)
+        except Exception:
+            _quit(conn)
+            raise
+        return conn
+
+    def get(self) -> smtplib.SMTP:
+        """
+        Check out a connection, opening a new one if the pool has room.
+        Blocks until a connection is returned when pool_size are in use.
+        """
+        while True:
+            with self._available:
+                while True:
+                    try:
+                        conn, idle_since = self._idle.get_nowait()
+                        break
+                    except queue.Empty:
+                        pass
+                    if self._open < self.pool_size:
+                        self._open += 1
+                        conn = None
+                        break
+                    self._available.wait()
+            if conn is None:
+                break
+
+            if self._is_alive(conn, idle_since):
+                return conn
+            self.discard(conn)
+
+        try:
+            conn = self._connect()
+        except Exception:
+            self._release_slot()
+            raise
+        self._sent_counts[conn] = 0
+        return conn
+
+    def _is_alive(self, conn: smtplib.SMTP, idle_since: float) -> bool:
+        """NOOP-check a connection that has sat idle long enough to be dropped."""
+        if time.monotonic() - idle_since < self.noop_after:
+            return True
+        try:
+            return conn.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def put(self, conn: smtplib.SMTP) -> None:
+        """
+        Return a healthy connection to the pool.
+        No RSET is needed: a completed send leaves the session ready for the
+        next MAIL FROM, and rejected sends are reset before being kept.
+        """
+        if self._sent_counts.get(conn, 0) >= self.max_messages_per_conn:
+            self.discard(conn)
+            return
+        with self._available:
+            self._idle.put((conn, time.monotonic()))
+            self._available.notify()
+
+    def discard(self, conn: smtplib.SMTP) -> None:
+        """Close a connection and free its slot in the pool."""
+        self._sent_counts.pop(conn, None)
+        _quit(conn)
+        self._release_slot()
+
+    def _release_slot(self) -> None:
+        """Give up a connection slot and wake one caller waiting in get()."""
+        with self._available:
+            self._open -= 1
+            self._available.notify()
+
+    def send_message(self, msg: Message) -> None:
+        """
+        Send a message over a pooled connection.
+        A connection the server has dropped is replaced once and the send retried.
+        """
+        with self.session() as session:
+            session.send_message(msg)
+
+    @contextmanager
+    def session(self) -> Iterator["PooledSession"]:
+        """
+        Hold one connection for a run of sends, returning it to the pool
+        afterwards.
+
+        Returns:
+            Context manager yielding a PooledSession
+        """
+        session = PooledSession(self)
+        try:
+            yield session
+        finally:
+            session.release()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self.discard(conn)
+
+
+class PooledSession:
+    """
+    A run of sends over one checked-out connection; see SMTPConnectionPool.session().
+
+    The connection is checked out on the first send and kept between sends,
+    so consecutive messages skip the pool's queue entirely. It is replaced
+    once if the server has dropped it, kept (after RSET) when the server
+    rejects a message, and recycled after the pool's max_messages_per_conn
+    messages.
+    """
+
+    def __init__(self, pool: SMTPConnectionPool):
+        self.pool = pool
+        self._conn: Optional[smtplib.SMTP] = None
+
+    def send_message(self, msg: Message) -> None:
+        """Send a message over the session's connection."""
+        pool = self.pool
+        conn, self._conn = self._conn or pool.get(), None
+        try:
+            conn.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            pool.discard(conn)
+            conn = pool.get()
+            try:
+                conn.send_message(msg)
+            except BaseException as e:
+                self._recover(conn, e)
+                raise
+        except BaseException as e:
+            self._recover(conn, e)
+            raise
+
+        sent = pool._sent_counts.get(conn, 0) + 1
+        pool._sent_counts[conn] = sent
+        if sent >= pool.max_messages_per_conn:
+            pool.discard(conn)
+        else:
+            self._conn = conn
+
+    def _recover(self, conn: smtplib.SMTP, error: BaseException) -> None:
+        """
+        Keep a connection after the server rejected a message, resetting the
+        half-finished transaction; drop it if the session itself broke.
+        """
+        if isinstance(error, smtplib.SMTPException) and not isinstance(
+            error, smtplib.SMTPServerDisconnected
+        ):
+            try:
+                conn.rset()
+            except (smtplib.SMTPException, OSError):
+                pass
+            else:
+                self._conn = conn
+                return
+        self.pool.discard(conn)
+
+    def release(self) -> None:
+        """Return the held connection (if any) to the pool."""
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            self.pool.put(conn)
@@ -2,19 +2,51 @@
 SMTP email provider implementation.
 Works with Gmail, Outlook, or any SMTP server.
 """
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from typing import Optional
+from contextlib import contextmanager
+from email.message import EmailMessage
+from email.utils import make_msgid
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from vello.core import config
 from vello.email.base import EmailResult
 
 
+def build_message(
+    to: str,
+    subject: str,
+    body_text: Optional[str],
+    body_html: Optional[str],
+    from_email: Optional[str],
+    message_id: Optional[str] = None
+) -> EmailMessage:
+    """Build a message with text and/or HTML bodies (multipart/alternative if both)."""
+    msg = EmailMessage()
+    if message_id:
+        msg['Message-ID'] = message_id
+    msg['Subject'] = subject
+    if from_email:
+        msg['From'] = from_email
+    msg['To'] = to
+
+    # Add body parts
+    if body_text:
+        msg.set_content(body_text)
+        if body_html:
+            msg.add_alternative(body_html, subtype='html')
+    elif body_html:
+        msg.set_content(body_html, subtype='html')
+    else:
+        msg.set_content('')
+
+    return msg
+
+
 class SMTPProvider:
     """
     SMTP email provider.
-    Implements EmailProvider protocol without inheritance.
+    Implements EmailProvider protocol without inheritance. Connections are
+    pooled across sends; use as a context manager or call close() to log
+    out when done.
     """
 
     def __init__(
@@ -24,7 +56,9 @@ class SMTPProvider:
         username: str,
         password: str,
         use_tls: bool = True,
-        default_from: Optional[str] = None
+        default_from: Optional[str] = None,
+        pool_size: int = 5,
+        max_messages_per_conn: int = 100
     ):
         self.host = host
         self.port = port
@@ -32,6 +66,20 @@ class SMTPProvider:
         self.password = password
         self.use_tls = use_tls
         self.default_from = default_from or username
+        # Imported here so modules that only need build_message()
+        # (e.g. the async provider) don't pull in smtplib
+        from vello.email.smtp_pool import SMTPConnectionPool
+
+        # Connections are reused across send_email() calls
+        self.pool = SMTPConnectionPool(
+            host=host,
+            port=port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            pool_size=pool_size,
+            max_messages_per_conn=max_messages_per_conn
+        )
 
     def send_email(
         self,
@@ -43,38 +91,78 @@ class SMTPProvider:
         **kwargs
     ) -> EmailResult:
         """Send email via SMTP."""
+        return self._send(
+            self.pool.send_message, to, subject, body_text, body_html, from_email
+        )
+
+    def _send(
+        self,
+        send_message: Callable[[EmailMessage], None],
+        to: str,
+        subject: str,
+        body_text: Optional[str],
+        body_html: Optional[str],
+        from_email: Optional[str],
+    ) -> EmailResult:
+        """Build a message and hand it to send_message, reporting any error."""
+        # Sent as the Message-ID header and stored on the delivery, so
+        # replies and bounces can be matched back to it
+        message_id = make_msgid(domain=self.host)
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = from_email or self.default_from
-            msg['To'] = to
-
-            # Add body parts
-            if body_text:
-                msg.attach(MIMEText(body_text, 'plain'))
-            if body_html:
-                msg.attach(MIMEText(body_html, 'html'))
-
-            # Connect and send
-            if self.use_tls:
-                server = smtplib.SMTP(self.host, self.port)
-                server.starttls()
-            else:
-                server = smtplib.SMTP_SSL(self.host, self.port)
-
-            server.login(self.username, self.password)
-            server.send_message(msg)
-            server.quit()
-
-            # SMTP doesn't return a message ID easily, so we'll generate one
-            message_id = f"<{hash(to + subject)}>@{self.host}"
-
-            return EmailResult(success=True, message_id=message_id)
+            msg = build_message(
+                to=to,
+                subject=subject,
+                body_text=body_text,
+                body_html=body_html,
+                from_email=from_email or self.default_from,
+                message_id=message_id
+            )
 
+            send_message(msg)
         except Exception as e:
             return EmailResult(success=False, error=str(e))
 
+        return EmailResult(success=True, message_id=message_id)
+
+    @contextmanager
+    def open_session(self) -> Iterator["SMTPSession"]:
+        """
+        Hold one pooled connection for a run of sends.
+
+        Example:
+            with provider.open_session() as session:
+                for message in messages:
+                    session.send(**message)
+
+        Returns:
+            Context manager yielding an SMTPSession
+        """
+        with self.pool.session() as pooled:
+            yield SMTPSession(self, pooled.send_message)
+
+    def send_batch(self, messages: List[Dict[str, Any]]) -> List[EmailResult]:
+        """
+        Send several emails, reusing the pooled connection between them.
+
+        Args:
+            messages: List of send_email() keyword-argument dicts
+
+        Returns:
+            One EmailResult per message, in order
+        """
+        with self.open_session() as session:
+            return [session.send(**message) for message in messages]
+
+    def close(self) -> None:
+        """Close all idle pooled connections."""
+        self.pool.close()
+
+    def __enter__(self) -> "SMTPProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def validate_config(self) -> bool:
         """Validate SMTP configuration."""
         return all([
@@ -85,6 +173,33 @@ class SMTPProvider:
         ])
 
 
+class SMTPSession:
+    """
+    Sends over the single connection held by SMTPProvider.open_session().
+    Not thread-safe: use one session per thread.
+    """
+
+    def __init__(
+        self, provider: SMTPProvider, send_message: Callable[[EmailMessage], None]
+    ):
+        self._provider = provider
+        self._send_message = send_message
+
+    def send(
+        self,
+        to: str,
+        subject: str,
+        body_text: Optional[str] = None,
+        body_html: Optional[str] = None,
+        from_email: Optional[str] = None,
+        **kwargs
+    ) -> EmailResult:
+        """Send an email; same arguments and result as SMTPProvider.send_email()."""
+        return self._provider._send(
+            self._send_message, to, subject, body_text, body_html, from_email
+        )
+
+
 def create_smtp_provider() -> SMTPProvider:
     """Factory function to create SMTP provider from config."""
     return SMTPProvider(
@@ -93,5 +208,7 @@ def create_smtp_provider() -> SMTPProvider:
         username=config.EMAIL_HOST_USER,
         password=config.EMAIL_HOST_PASSWORD,
         use_tls=config.EMAIL_USE_TLS,
-        default_from=config.EMAIL_HOST_USER
+        default_from=config.EMAIL_HOST_USER,
+        # Enough connections for every concurrent sender
+        pool_size=max(5, config.SMTP_CONCURRENCY)
     )
@@ -1,7 +1,7 @@
 """
 Services module for business logic.
 """
-from vello.services.analysis import analyze_intent
+from vello.services.analysis import analyze_intent, analyze_intent_batch
 from vello.services.campaign_manager import CampaignManager
 
-__all__ = ['analyze_intent', 'CampaignManager']
+__all__ = ['analyze_intent', 'analyze_intent_batch', 'CampaignManager']
@@ -1,10 +1,27 @@
 """
 Campaign Manager - Orchestrates campaign execution, scheduling, and follow-ups.
 """
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from sqlalchemy.orm import Session
+import itertools
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import (
+    and_,
+    case,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, aliased, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from vello.core import config, db
 from vello.core.models import (
@@ -17,8 +34,21 @@ from vello.core.models import (
 )
 from vello.email import EmailProvider, EmailResult
 from vello.services import analyze_intent
+from vello.services.dispatch import dispatch
 from vello.utils import TemplateLoader, html_to_text
 
+# Group-commit defaults for delivery status updates
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.01  # seconds
+
+# A batch stops sending once more than this share of its sends have failed,
+# after at least MIN_FAILURE_SAMPLE attempts
+MAX_FAILURE_RATIO = 1 / 3
+MIN_FAILURE_SAMPLE = 10
+
+# Values per IN (...) lookup, well under every driver's bound-parameter limit
+IN_CHUNK_SIZE = 1000
+
 
 class CampaignManager:
     """
@@ -37,6 +67,9 @@ class CampaignManager:
         email_provider: EmailProvider,
         template_loader: Optional[TemplateLoader] = None,
         db_session: Optional[Session] = None,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        send_workers: Optional[int] = None,
     ):
         """
         Initialize CampaignManager.
@@ -45,10 +78,22 @@ class CampaignManager:
             email_provider: Email provider instance (dependency injection)
             template_loader: Template loader instance (optional, creates default if None)
             db_session: Database session (optional, uses get_db() if None)
+            max_batch: Max delivery status updates to buffer before committing
+            max_wait: Max seconds a buffered status update may wait for a commit
+            send_workers: Max concurrent sends
+                          (defaults to config.SMTP_CONCURRENCY)
         """
         self.email_provider = email_provider
         self.template_loader = template_loader
         self.db_session = db_session
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.send_workers = send_workers or config.SMTP_CONCURRENCY
+        # Buffered (delivery, changed column values) awaiting a group commit
+        self._pending_updates: List[Tuple[Delivery, Dict[str, Any]]] = []
+        self._flush_deadline = 0.0
+        # campaign_id -> counter column -> increment, applied on flush
+        self._counter_deltas: Dict[int, Counter] = defaultdict(Counter)
 
     def _get_db(self) -> Session:
         """Get database session."""
@@ -117,33 +162,42 @@ class CampaignManager:
         """
         session = self._get_db()
         try:
-            count = 0
-            for email in emails:
-                # Check if already exists
-                existing = (
-                    session.query(Recipient)
-                    .filter_by(campaign_id=campaign_id, email=email)
-                    .first()
+            # Drop repeats within this call; they'd violate the unique key
+            unique_emails = list(dict.fromkeys(emails))
+
+            # Look up which emails are already in the campaign, one chunked
+            # IN query at a time instead of one query per email
+            existing = set()
+            for start in range(0, len(unique_emails), IN_CHUNK_SIZE):
+                chunk = unique_emails[start : start + IN_CHUNK_SIZE]
+                existing.update(
+                    session.scalars(
+                        select(Recipient.email).where(
+                            Recipient.campaign_id == campaign_id,
+                            Recipient.email.in_(chunk),
+                        )
+                    )
                 )
 
-                if existing:
-                    continue
-
-                recipient = Recipient(
-                    campaign_id=campaign_id,
-                    email=email,
-                    name=names.get(email) if names else None,
-                    vars_json=str(vars_json.get(email))
-                    if vars_json and vars_json.get(email)
-                    else None,
-                    suppressed=False,
-                    created_at=datetime.utcnow(),
-                )
-                session.add(recipient)
-                count += 1
+            rows = [
+                {
+                    "campaign_id": campaign_id,
+                    "email": email,
+                    "name": names.get(email) if names else None,
+                    "vars_json": (vars_json.get(email) or None) if vars_json else None,
+                    "suppressed": False,
+                }
+                for email in unique_emails
+                if email not in existing
+            ]
+
+            # One executemany INSERT instead of a unit-of-work add per row;
+            # created_at comes from the column's server default
+            if rows:
+                session.execute(insert(Recipient), rows)
 
             session.commit()
-            return count
+            return len(rows)
         except Exception:
             session.rollback()
             raise
@@ -157,6 +211,9 @@ class CampaignManager:
         - Delay time has elapsed
         - Recipient is not suppressed
 
+        Sending stops early if more than MAX_FAILURE_RATIO of the sends fail;
+        deliveries not yet sent stay pending.
+
         Args:
             campaign_id: Optional campaign ID to filter by (None = all campaigns)
 
@@ -168,107 +225,260 @@ class CampaignManager:
             # Query pending deliveries
             query = (
                 session.query(Delivery)
+                .options(
+                    # Ready deliveries render their step, so load its bodies now
+                    selectinload(Delivery.step).undefer_group("bodies"),
+                    selectinload(Delivery.recipient),
+                    # Anything else touched per row would be an N+1; fail loudly
+                    raiseload("*"),
+                )
                 .join(Recipient)
                 .join(CampaignStep)
                 .filter(
                     Delivery.status == DeliveryStatus.PENDING,
-                    not Recipient.suppressed,
+                    Recipient.suppressed.is_(False),
+                    # Delay checks run in SQL, so unready rows are never loaded
+                    self._ready_to_send(session, campaign_id),
                 )
             )
 
             if campaign_id:
                 query = query.filter(Recipient.campaign_id == campaign_id)
 
-            pending_deliveries = query.all()
+            ready = (
+                (delivery, delivery.step, delivery.recipient)
+                for delivery in query.all()
+            )
 
             sent_count = 0
-            for delivery in pending_deliveries:
-                # Check if delay has elapsed
-                step = delivery.step
-                recipient = delivery.recipient
-                campaign = recipient.campaign
-
-                # Calculate when this should be sent
-                # First step: send immediately after recipient creation
-                # Subsequent steps: after previous step + delay
-                if step.position == 0:
-                    # First step - check if recipient was created long enough ago
-                    time_since_creation = datetime.utcnow() - recipient.created_at
-                    if time_since_creation.total_seconds() < step.delay_minutes * 60:
-                        continue
-                else:
-                    # Find previous step delivery
-                    prev_step = (
-                        session.query(CampaignStep)
-                        .filter_by(campaign_id=campaign.id, position=step.position - 1)
-                        .first()
+            with ExitStack() as stack:
+                send = self.email_provider.send_email
+                if self.send_workers == 1 and hasattr(
+                    self.email_provider, "open_session"
+                ):
+                    # Hold one connection for the whole batch; concurrent
+                    # sends go through send_email() and the provider's pool
+                    send = stack.enter_context(self.email_provider.open_session()).send
+
+                # Stop sending once too many sends have failed (e.g. the
+                # server is rejecting us); the rest stay pending for the
+                # next run. Counted by the senders, which see each result
+                # as soon as it's known.
+                attempted = failed = 0
+                counts_lock = threading.Lock()
+
+                def send_unless_failing(item):
+                    nonlocal attempted, failed
+                    if self._too_many_failures(attempted, failed):
+                        return None
+                    result = send(**item[1])
+                    with counts_lock:
+                        attempted += 1
+                        failed += not result.success
+                    return result
+
+                # Keep finding ready deliveries on this thread while sender
+                # threads send them; results come back in order as they finish
+                outbox = (
+                    (delivery, self._build_campaign_email(step, recipient))
+                    for delivery, step, recipient in itertools.takewhile(
+                        lambda _: not self._too_many_failures(attempted, failed),
+                        ready,
                     )
+                )
+                results = (
+                    (delivery, result)
+                    for (delivery, _), result in dispatch(
+                        outbox, send_unless_failing, workers=self.send_workers
+                    )
+                )
 
-                    if prev_step:
-                        prev_delivery = (
-                            session.query(Delivery)
-                            .filter_by(recipient_id=recipient.id, step_id=prev_step.id)
-                            .first()
-                        )
-
-                        if (
-                            not prev_delivery
-                            or prev_delivery.status != DeliveryStatus.SENT
-                        ):
-                            continue
-
-                        if prev_delivery.sent_at:
-                            time_since_prev = datetime.utcnow() - prev_delivery.sent_at
-                            if (
-                                time_since_prev.total_seconds()
-                                < step.delay_minutes * 60
-                            ):
-                                continue
-
-                # Send the email
-                result = self._send_campaign_email(delivery, step, recipient)
-
-                if result.success:
-                    delivery.status = DeliveryStatus.SENT
-                    delivery.sent_at = datetime.utcnow()
-                    delivery.message_id = result.message_id
-                    sent_count += 1
-                else:
-                    delivery.status = DeliveryStatus.FAILED
-                    delivery.last_error = result.error
+                for delivery, result in results:
+                    if result is None:
+                        # Skipped after the batch stopped; still pending
+                        continue
 
-            session.commit()
+                    counters = self._counter_deltas[delivery.recipient.campaign_id]
+                    if result.success:
+                        # sent_at is filled in when the batch is flushed
+                        values = {
+                            "status": DeliveryStatus.SENT,
+                            "message_id": result.message_id,
+                        }
+                        counters["sent_count"] += 1
+                        sent_count += 1
+                    else:
+                        values = {
+                            "status": DeliveryStatus.FAILED,
+                            "last_error": result.error,
+                        }
+                        counters["failed_count"] += 1
+
+                    self._record_delivery_update(session, delivery, values)
+
+            self._flush_delivery_updates(session)
             return sent_count
         except Exception:
+            self._pending_updates.clear()
+            self._counter_deltas.clear()
             session.rollback()
             raise
 
-    def _send_campaign_email(
-        self, delivery: Delivery, step: CampaignStep, recipient: Recipient
-    ) -> EmailResult:
+    @staticmethod
+    def _ready_to_send(session: Session, campaign_id: Optional[int] = None):
         """
-        Send a campaign email for a specific delivery.
+        SQL condition for a pending delivery whose send delay has elapsed.
+        Must be used in a query joining Delivery, Recipient and CampaignStep.
+
+        First step: delay_minutes after the recipient was created.
+        Later steps: delay_minutes after the previous step's delivery was
+        sent; never if it hasn't been sent, immediately if the previous
+        step doesn't exist.
+
+        Each step's delay becomes a cutoff timestamp computed here, so the
+        check is a plain timestamp comparison that works on any database.
+        """
+        delays_query = session.query(CampaignStep.delay_minutes).distinct()
+        if campaign_id:
+            delays_query = delays_query.filter(CampaignStep.campaign_id == campaign_id)
+        delays = [delay for (delay,) in delays_query]
+        if not delays:
+            return false()
+
+        now = datetime.utcnow()
+        # Latest timestamp from which this step's delay has elapsed
+        cutoff = case(
+            {delay: now - timedelta(minutes=delay) for delay in delays},
+            value=CampaignStep.delay_minutes,
+        )
+
+        prev_step = aliased(CampaignStep)
+        prev_delivery = aliased(Delivery)
+        is_previous_step = and_(
+            prev_step.campaign_id == CampaignStep.campaign_id,
+            prev_step.position == CampaignStep.position - 1,
+        )
+
+        first_step_ready = and_(
+            CampaignStep.position == 0,
+            Recipient.created_at <= cutoff,
+        )
+        no_previous_step = and_(
+            CampaignStep.position > 0,
+            ~select(prev_step.id).where(is_previous_step).exists(),
+        )
+        previous_sent_long_enough_ago = (
+            select(prev_delivery.id)
+            .join(prev_step, prev_step.id == prev_delivery.step_id)
+            .where(
+                is_previous_step,
+                prev_delivery.recipient_id == Delivery.recipient_id,
+                prev_delivery.status == DeliveryStatus.SENT,
+                or_(prev_delivery.sent_at.is_(None), prev_delivery.sent_at <= cutoff),
+            )
+            .exists()
+        )
+        return or_(first_step_ready, no_previous_step, previous_sent_long_enough_ago)
+
+    @staticmethod
+    def _too_many_failures(attempted: int, failed: int) -> bool:
+        """Whether a batch's failure rate is high enough to stop sending."""
+        if attempted < MIN_FAILURE_SAMPLE:
+            return False
+        return failed > attempted * MAX_FAILURE_RATIO
+
+    def _record_delivery_update(
+        self, session: Session, delivery: Delivery, values: Dict[str, Any]
+    ) -> None:
+        """
+        Buffer a delivery status change, committing once the batch is full
+        or the oldest buffered change has waited max_wait seconds.
+
+        Args:
+            session: Database session
+            delivery: Delivery to update
+            values: Column name -> new value
+        """
+        now = time.monotonic()
+        if not self._pending_updates:
+            self._flush_deadline = now + self.max_wait
+        self._pending_updates.append((delivery, values))
+
+        if len(self._pending_updates) >= self.max_batch or now >= self._flush_deadline:
+            self._flush_delivery_updates(session)
+
+    def _flush_delivery_updates(self, session: Session) -> None:
+        """Write all buffered status changes in a single commit."""
+        updates, self._pending_updates = self._pending_updates, []
+        if updates:
+            # One timestamp per group commit rather than one per row
+            sent_at = datetime.utcnow()
+            for _, values in updates:
+                if values["status"] == DeliveryStatus.SENT:
+                    values["sent_at"] = sent_at
+            # ORM bulk UPDATE by primary key: one executemany per set of columns
+            session.execute(
+                update(Delivery),
+                [{"id": delivery.id, **values} for delivery, values in updates],
+            )
+
+        # Counters commit together with the statuses they count
+        self._apply_counter_deltas(session, self._counter_deltas)
+        self._counter_deltas.clear()
+        # Keep the rows still being processed loaded across this commit, so
+        # each group commit doesn't make them reload
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = False
+        try:
+            session.commit()
+        finally:
+            session.expire_on_commit = expire_on_commit
+
+        # The bulk UPDATE bypasses loaded objects; bring them up to date
+        # without marking them dirty
+        for delivery, values in updates:
+            for key, value in values.items():
+                set_committed_value(delivery, key, value)
+
+    @staticmethod
+    def _apply_counter_deltas(session: Session, deltas: Dict[int, Counter]) -> None:
+        """
+        Add pending increments to the denormalized Campaign counters.
+
+        Args:
+            session: Database session
+            deltas: campaign_id -> {counter column name: increment}
+        """
+        for campaign_id, counters in deltas.items():
+            values = {
+                column: getattr(Campaign, column) + delta
+                for column, delta in counters.items()
+                if delta
+            }
+            if values:
+                session.execute(
+                    update(Campaign).where(Campaign.id == campaign_id).values(values)
+                )
+
+    def _build_campaign_email(
+        self, step: CampaignStep, recipient: Recipient
+    ) -> Dict[str, Any]:
+        """
+        Build the send_email() arguments for a campaign step and recipient.
 
         Args:
-            delivery: Delivery record
             step: Campaign step
             recipient: Recipient
 
         Returns:
-            EmailResult from email provider
+            Dictionary of keyword arguments for EmailProvider.send_email
         """
         # Get template variables if available
-        variables = {}
-        if recipient.vars_json:
-            import json
-
-            try:
-                variables = json.loads(recipient.vars_json)
-            except Exception:
-                pass
+        # Copied: the defaults below mustn't leak into the loaded column value
+        variables = dict(recipient.vars_json or {})
 
         # Add default variables
-        variables.setdefault("name", recipient.name or recipient.email.split("@")[0])
+        variables.setdefault("name", recipient.display_name)
         variables.setdefault("email", recipient.email)
 
         # Use template if body_html/body_text not set
@@ -282,15 +492,30 @@ class CampaignManager:
         # TODO: If step has template_path, use template_loader
         # For now, use direct body_html/body_text
 
-        # Send email
-        result = self.email_provider.send_email(
-            to=recipient.email,
-            subject=step.subject,
-            body_text=body_text,
-            body_html=body_html,
-        )
+        return {
+            "to": recipient.email,
+            "subject": step.subject,
+            "body_text": body_text,
+            "body_html": body_html,
+        }
 
-        return result
+    def _send_campaign_email(
+        self, delivery: Delivery, step: CampaignStep, recipient: Recipient
+    ) -> EmailResult:
+        """
+        Send a campaign email for a specific delivery.
+
+        Args:
+            delivery: Delivery record
+            step: Campaign step
+            recipient: Recipient
+
+        Returns:
+            EmailResult from email provider
+        """
+        return self.email_provider.send_email(
+            **self._build_campaign_email(step, recipient)
+        )
 
     def handle_response(
         self, recipient_email: str, content: str, delivery_id: Optional[int] = None
@@ -329,6 +554,7 @@ class CampaignManager:
                 created_at=datetime.utcnow(),
             )
             session.add(response)
+            counters: Counter = Counter()
 
             # Auto-actions based on config
             if (
@@ -336,19 +562,23 @@ class CampaignManager:
                 and status == ResponseStatus.UNSUBSCRIBED
             ):
                 recipient.suppressed = True
-                # Stop all pending deliveries for this recipient
-                pending_deliveries = (
-                    session.query(Delivery)
-                    .join(CampaignStep)
-                    .filter(
+                # Stop all pending deliveries for this recipient in one UPDATE
+                cancelled = session.execute(
+                    update(Delivery)
+                    .where(
                         Delivery.recipient_id == recipient.id,
                         Delivery.status == DeliveryStatus.PENDING,
                     )
-                    .all()
-                )
-                for delivery in pending_deliveries:
-                    delivery.status = DeliveryStatus.FAILED
-                    delivery.last_error = "Recipient unsubscribed"
+                    .values(
+                        status=DeliveryStatus.FAILED,
+                        last_error="Recipient unsubscribed",
+                    )
+                ).rowcount
+                counters["failed_count"] += cancelled
+
+            if status == ResponseStatus.POSITIVE:
+                counters["positive_count"] += 1
+            self._apply_counter_deltas(session, {recipient.campaign_id: counters})
 
             # TODO: Handle positive/negative responses based on AUTO_ACT_ON_RESPONSE
 
@@ -362,6 +592,9 @@ class CampaignManager:
         """
         Get statistics for a campaign.
 
+        Sent, failed and positive come from the campaign's counters, which
+        only CampaignManager maintains; see db.recompute_campaign_counters().
+
         Args:
             campaign_id: Campaign ID
 
@@ -369,59 +602,70 @@ class CampaignManager:
             Dictionary with campaign statistics
         """
         session = self._get_db()
-        campaign = session.query(Campaign).filter_by(id=campaign_id).first()
-        if not campaign:
+        # Stats only need counts, so let the database aggregate them rather
+        # than loading every recipient, delivery and response row
+        row = (
+            session.query(
+                Campaign.name,
+                Campaign.sent_count,
+                Campaign.failed_count,
+                Campaign.positive_count,
+            )
+            .filter(Campaign.id == campaign_id)
+            .one_or_none()
+        )
+        if row is None:
             return {}
+        campaign_name, sent_count, failed_count, positive_count = row
 
-        recipients = session.query(Recipient).filter_by(campaign_id=campaign_id).all()
-        total_recipients = len(recipients)
-        suppressed = sum(1 for r in recipients if r.suppressed)
+        total_recipients, suppressed = (
+            session.query(
+                func.count(),
+                func.coalesce(func.sum(case((Recipient.suppressed, 1), else_=0)), 0),
+            )
+            .filter(Recipient.campaign_id == campaign_id)
+            .one()
+        )
 
-        # Count deliveries by status
-        deliveries = (
-            session.query(Delivery)
+        is_pending = case((Delivery.status == DeliveryStatus.PENDING, 1), else_=0)
+        total_deliveries, pending_count = (
+            session.query(
+                func.count(Delivery.id),
+                func.coalesce(func.sum(is_pending), 0),
+            )
             .join(Recipient)
             .filter(Recipient.campaign_id == campaign_id)
-            .all()
+            .one()
         )
 
-        sent = sum(1 for d in deliveries if d.status == DeliveryStatus.SENT)
-        pending = sum(1 for d in deliveries if d.status == DeliveryStatus.PENDING)
-        failed = sum(1 for d in deliveries if d.status == DeliveryStatus.FAILED)
-
-        # Count responses
+        # Count responses by status
         from vello.core.models import Response
 
-        responses = (
-            session.query(Response)
+        response_counts = dict(
+            session.query(Response.status, func.count())
             .join(Recipient)
             .filter(Recipient.campaign_id == campaign_id)
+            .group_by(Response.status)
             .all()
         )
 
-        positive = sum(1 for r in responses if r.status == ResponseStatus.POSITIVE)
-        negative = sum(1 for r in responses if r.status == ResponseStatus.NEGATIVE)
-        unsubscribed = sum(
-            1 for r in responses if r.status == ResponseStatus.UNSUBSCRIBED
-        )
-
         return {
             "campaign_id": campaign_id,
-            "campaign_name": campaign.name,
+            "campaign_name": campaign_name,
             "total_recipients": total_recipients,
             "suppressed": suppressed,
             "active_recipients": total_recipients - suppressed,
             "deliveries": {
-                "sent": sent,
-                "pending": pending,
-                "failed": failed,
-                "total": len(deliveries),
+                "sent": sent_count,
+                "pending": pending_count,
+                "failed": failed_count,
+                "total": total_deliveries,
             },
             "responses": {
-                "positive": positive,
-                "negative": negative,
-                "unsubscribed": unsubscribed,
-                "total": len(responses),
+                "positive": positive_count,
+                "negative": response_counts.get(ResponseStatus.NEGATIVE, 0),
+                "unsubscribed": response_counts.get(ResponseStatus.UNSUBSCRIBED, 0),
+                "total": sum(response_counts.values()),
             },
         }
 
@@ -438,45 +682,42 @@ class CampaignManager:
         """
         session = self._get_db()
         try:
-            campaign = session.query(Campaign).filter_by(id=campaign_id).first()
-            if not campaign:
-                return 0
-
-            # Get first step
-            first_step = (
-                session.query(CampaignStep)
+            # Get first step (none if the campaign doesn't exist)
+            first_step_id = (
+                session.query(CampaignStep.id)
                 .filter_by(campaign_id=campaign_id, position=0)
-                .first()
+                .scalar()
             )
 
-            if not first_step:
+            if first_step_id is None:
                 return 0
 
-            # Get all active recipients
-            recipients = (
-                session.query(Recipient)
-                .filter_by(campaign_id=campaign_id, suppressed=False)
-                .all()
+            # Active recipients without a first-step delivery yet
+            has_delivery = (
+                select(Delivery.id)
+                .where(
+                    Delivery.recipient_id == Recipient.id,
+                    Delivery.step_id == first_step_id,
+                )
+                .exists()
+            )
+            missing = select(
+                literal(first_step_id),
+                Recipient.id,
+                literal(DeliveryStatus.PENDING, Delivery.status.type),
+            ).where(
+                Recipient.campaign_id == campaign_id,
+                Recipient.suppressed.is_(False),
+                ~has_delivery,
             )
 
-            count = 0
-            for recipient in recipients:
-                # Check if delivery already exists
-                existing = (
-                    session.query(Delivery)
-                    .filter_by(recipient_id=recipient.id, step_id=first_step.id)
-                    .first()
+            # One INSERT ... SELECT instead of a lookup and insert per
+            # recipient; created_at comes from the column's server default
+            count = session.execute(
+                insert(Delivery).from_select(
+                    ["step_id", "recipient_id", "status"], missing
                 )
-
-                if not existing:
-                    delivery = Delivery(
-                        step_id=first_step.id,
-                        recipient_id=recipient.id,
-                        status=DeliveryStatus.PENDING,
-                        created_at=datetime.utcnow(),
-                    )
-                    session.add(delivery)
-                    count += 1
+            ).rowcount
 
             session.commit()
             return count
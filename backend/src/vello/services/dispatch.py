@@ -0,0 +1,192 @@
+"""
+Dispatch - Hands ready deliveries from the thread that finds them to a
+sender thread through a single-producer/single-consumer queue.
+"""
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Callable,
+    Deque,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Max items the producer may run ahead of the sender
+DEFAULT_MAXSIZE = 256
+
+
+class ReadyQueue(Generic[T]):
+    """
+    FIFO for exactly one producer thread and one consumer thread.
+
+    deque.append() and deque.popleft() are atomic in CPython, so items move
+    between the threads without a lock. The two events are only waited on
+    when the consumer runs dry or the producer gets maxsize items ahead.
+    """
+
+    def __init__(self, maxsize: Optional[int] = DEFAULT_MAXSIZE):
+        """
+        Args:
+            maxsize: Max queued items before push() blocks (None = unbounded)
+        """
+        self.maxsize = maxsize
+        self._items: Deque[T] = deque()
+        self._not_empty = threading.Event()
+        self._not_full = threading.Event()
+        self._not_full.set()
+        self._closed = False
+
+    def push(self, item: T) -> None:
+        """Append an item, blocking while the queue is full. Producer only."""
+        if self.maxsize is not None:
+            while len(self._items) >= self.maxsize:
+                # Clear, then re-check, so a pop in between can't be missed
+                self._not_full.clear()
+                if len(self._items) >= self.maxsize:
+                    self._not_full.wait()
+        self._items.append(item)
+        self._not_empty.set()
+
+    def close(self) -> None:
+        """Mark the end of input; the consumer stops once the queue drains."""
+        self._closed = True
+        self._not_empty.set()
+
+    def drain(self) -> Iterator[T]:
+        """Pop whatever is queued right now without blocking. Consumer only."""
+        while self._items:
+            yield self._pop()
+
+    def __iter__(self) -> Iterator[T]:
+        """Pop items as they arrive until closed and empty. Consumer only."""
+        while True:
+            if self._items:
+                yield self._pop()
+                continue
+            if self._closed:
+                # close() may have raced with a final push
+                if not self._items:
+                    return
+                continue
+            self._not_empty.clear()
+            if not self._items and not self._closed:
+                self._not_empty.wait()
+
+    def _pop(self) -> T:
+        item = self._items.popleft()
+        self._not_full.set()
+        return item
+
+
+def dispatch(
+    items: Iterable[T],
+    send: Callable[[T], R],
+    maxsize: int = DEFAULT_MAXSIZE,
+    workers: int = 1,
+) -> Iterator[Tuple[T, R]]:
+    """
+    Call send() on each item from a background sender thread.
+
+    items is consumed on the calling thread (so it may use a database
+    session), while send() runs on the sender thread, or on a pool of
+    `workers` threads when workers > 1. Results are yielded on the calling
+    thread in the order the items were produced, as soon as they are
+    available, so the caller can record them while production continues.
+
+    Args:
+        items: Items to send; iterated lazily on the calling thread
+        send: Function run for each item; must be thread-safe if workers > 1
+        maxsize: Max items the producer may run ahead of the sender
+        workers: Max send() calls running at once
+
+    Returns:
+        Iterator of (item, send(item)) pairs
+
+    Raises:
+        The first exception raised by send(), after the results of every
+        send() already started are yielded; no new sends start after it
+    """
+    outbox: ReadyQueue[T] = ReadyQueue(maxsize)
+    # Unbounded, so the sender never blocks on a producer that is itself blocked
+    done: ReadyQueue[Tuple[T, R]] = ReadyQueue(None)
+    errors: List[BaseException] = []
+    # Set when the caller stops reading early; queued items are then dropped
+    # rather than sent, since nobody would record their results
+    cancelled = threading.Event()
+
+    def stopped() -> bool:
+        return bool(errors) or cancelled.is_set()
+
+    def consume() -> None:
+        try:
+            for item in outbox:
+                if stopped():
+                    # Keep draining so the producer never blocks on a full queue
+                    continue
+                try:
+                    done.push((item, send(item)))
+                except BaseException as e:
+                    errors.append(e)
+        finally:
+            done.close()
+
+    def consume_pooled() -> None:
+        # Oldest first, so results are pushed in item order
+        in_flight: Deque[Tuple[T, "Future[R]"]] = deque()
+
+        def finish_oldest() -> None:
+            item, future = in_flight.popleft()
+            try:
+                done.push((item, future.result()))
+            except BaseException as e:
+                errors.append(e)
+
+        try:
+            with ThreadPoolExecutor(workers, thread_name_prefix="vello-send") as pool:
+                for item in outbox:
+                    if stopped():
+                        continue
+                    if len(in_flight) >= workers:
+                        finish_oldest()
+                        if stopped():
+                            continue
+                    in_flight.append((item, pool.submit(send, item)))
+                while in_flight:
+                    finish_oldest()
+        finally:
+            done.close()
+
+    sender = threading.Thread(
+        target=consume_pooled if workers > 1 else consume,
+        name="vello-dispatch",
+        daemon=True,
+    )
+    sender.start()
+
+    try:
+        try:
+            for item in items:
+                if errors:
+                    break
+                outbox.push(item)
+                yield from done.drain()
+        finally:
+            outbox.close()
+
+        yield from done
+    finally:
+        # Runs early if the caller closes the iterator or items raises; sends
+        # already started finish, everything still queued is discarded
+        cancelled.set()
+        sender.join()
+    if errors:
+        raise errors[0]
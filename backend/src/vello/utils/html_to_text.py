@@ -2,12 +2,34 @@
 Utility to convert HTML email content to plain text.
 Uses html2text library (lightweight alternative to BeautifulSoup).
 """
+import functools
+import re
+
 import html2text
 
+# Trailing whitespace on each line (not the newline itself)
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+# Runs of more than one blank line
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+
+def _create_converter() -> html2text.HTML2Text:
+    """Create an HTML2Text converter configured for email-friendly output."""
+    h = html2text.HTML2Text()
+    h.ignore_links = False  # Keep links as [text](url)
+    h.ignore_images = True  # Remove images
+    h.body_width = 0  # Don't wrap lines (preserve original formatting)
+    h.unicode_snob = True  # Use unicode characters
+    h.skip_internal_links = True  # Skip anchor links
+    return h
+
 
+@functools.lru_cache(maxsize=512)
 def html_to_text(html_content: str) -> str:
     """
     Convert HTML email content to plain text.
+    Results are cached per HTML string, since a campaign step sends the
+    same body to every recipient; call html_to_text.cache_clear() to reset.
     
     Args:
         html_content: HTML string to convert
@@ -15,24 +37,13 @@ def html_to_text(html_content: str) -> str:
     Returns:
         Plain text version of the HTML content
     """
-    # Configure html2text for email-friendly output
-    h = html2text.HTML2Text()
-    h.ignore_links = False  # Keep links as [text](url)
-    h.ignore_images = True  # Remove images
-    h.body_width = 0  # Don't wrap lines (preserve original formatting)
-    h.unicode_snob = True  # Use unicode characters
-    h.skip_internal_links = True  # Skip anchor links
-    
-    # Convert HTML to text
-    text = h.handle(html_content)
+    # Converters keep parser state, so each call gets a fresh one
+    text = _create_converter().handle(html_content)
     
     # Clean up extra whitespace while preserving structure
-    lines = [line.rstrip() for line in text.split('\n')]
-    text = '\n'.join(lines)
+    text = _TRAILING_WS_RE.sub('', text)
     
     # Remove excessive blank lines (more than 2 consecutive)
-    while '\n\n\n' in text:
-        text = text.replace('\n\n\n', '\n\n')
+    text = _BLANK_LINES_RE.sub('\n\n', text)
     
     return text.strip()
-
@@ -2,18 +2,103 @@
 Template loader using Jinja2 for email templates.
 """
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from functools import lru_cache
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    TemplateSyntaxError,
+    select_autoescape,
+)
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
+import logging
 import os
 
 from vello.utils.html_to_text import html_to_text
 
+logger = logging.getLogger(__name__)
+
 # Template directory - now relative to backend directory
 # From backend/src/vello/utils/template_loader.py -> backend/templates
 _backend_dir = Path(__file__).parent.parent.parent.parent
 TEMPLATE_DIR = _backend_dir / "templates"
 
+# Environment variable naming a directory for compiled template bytecode,
+# kept across restarts. Read here rather than in vello.core.config so
+# vello.utils doesn't import the database. Unset: no bytecode cache.
+BYTECODE_CACHE_DIR_ENV = "JINJA_BYTECODE_CACHE_DIR"
+
+
+def _walk_templates(
+    template_dir: Path, extension: str, category: Optional[str] = None
+) -> Iterator[str]:
+    """
+    Yield the names of template files ending in extension.
+
+    Walks with os.scandir, whose entries already know their file type, so
+    no Path objects or extra stat calls are made per file.
+
+    Args:
+        template_dir: Templates root directory
+        extension: File extension to match (e.g., ".html")
+        category: Optional subdirectory to limit the walk to
+
+    Returns:
+        Iterator of '/'-separated paths relative to template_dir, without
+        the extension
+    """
+    root = template_dir / category if category else template_dir
+    prefix = f"{category.strip('/')}/" if category else ""
+    stack = [(str(root), prefix)]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, f"{prefix}{entry.name}/"))
+                elif entry.name.endswith(extension):
+                    yield prefix + entry.name[: -len(extension)]
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Bytecode cache in $JINJA_BYTECODE_CACHE_DIR, or None if it's unset."""
+    cache_dir = os.getenv(BYTECODE_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+
+    cache_dir = Path(cache_dir)
+    # Cached bytecode is executed, so only the owner may write here
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return FileSystemBytecodeCache(str(cache_dir), "vello-%s.cache")
+
+
+@lru_cache(maxsize=None)
+def _get_environment(template_dir: Path) -> Environment:
+    """
+    Jinja2 environment for email templates in template_dir.
+
+    Built on first use and shared by every loader of the same directory, so
+    each template is compiled once per process however many TemplateLoaders
+    are created, and importing this module has no side effects.
+    """
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=select_autoescape(["html", "xml"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates don't change at runtime: keep every compiled template
+        # and skip the mtime check on each get_template()
+        cache_size=-1,
+        auto_reload=False,
+        # Persist compiled bytecode across processes and restarts
+        bytecode_cache=_create_bytecode_cache(),
+    )
+
 
 class TemplateLoader:
     """Loads and renders email templates using Jinja2."""
@@ -25,13 +110,44 @@ class TemplateLoader:
         Args:
             template_dir: Path to templates directory (defaults to backend/templates)
         """
-        self.template_dir = template_dir or TEMPLATE_DIR
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.template_dir = Path(template_dir or TEMPLATE_DIR)
+        self.env = _get_environment(self.template_dir)
+        # Per-instance memo of render_email() results, keyed by variables
+        self._render_email_cached = lru_cache(maxsize=4096)(self._render_email_items)
+        # Per-instance memo of list_templates() results, keyed by category
+        self._list_templates_cached = lru_cache(maxsize=16)(self._scan_templates)
+        # Templates with a hand-written .txt version; the rest get theirs
+        # generated from the HTML
+        self._txt_templates = self._scan_txt_templates()
+        self.preload_templates()
+
+    def refresh(self) -> None:
+        """Forget cached template listings so new or removed files are seen."""
+        self._list_templates_cached.cache_clear()
+        self._txt_templates = self._scan_txt_templates()
+
+    def _scan_txt_templates(self) -> frozenset:
+        """Names (without extension) of every .txt template."""
+        return frozenset(_walk_templates(self.template_dir, ".txt"))
+
+    def preload_templates(self) -> None:
+        """
+        Compile every template up front so the first render is already warm.
+        With a bytecode cache, this also writes each template's bytecode on
+        first boot, so later processes load it instead of compiling.
+
+        A template that fails to compile is logged and skipped, so it only
+        fails when it is actually rendered.
+        """
+        for template_name in self.list_templates():
+            paths = [f"{template_name}.html"]
+            if template_name in self._txt_templates:
+                paths.append(f"{template_name}.txt")
+            for path in paths:
+                try:
+                    self.env.get_template(path)
+                except TemplateSyntaxError as e:
+                    logger.warning("Skipping template %s: %s", path, e)
 
     def render(self, template_path: str, variables: Dict[str, Any]) -> str:
         """
@@ -63,15 +179,36 @@ class TemplateLoader:
         Returns:
             Tuple of (html_content, text_content)
         """
+        # Identical variable sets (e.g. shared test sends) hit the memo;
+        # the type is part of the key so 1 and True don't collide
+        try:
+            items = frozenset(
+                (key, type(value), value) for key, value in variables.items()
+            )
+        except TypeError:
+            # Unhashable values (lists, dicts): render without caching
+            return self._render_email(template_name, variables, include_text)
+        return self._render_email_cached(template_name, items, include_text)
+
+    def _render_email_items(
+        self, template_name: str, items: frozenset, include_text: bool
+    ) -> tuple[str, Optional[str]]:
+        """render_email() for a hashable (key, type, value) variable set."""
+        variables = {key: value for key, _, value in items}
+        return self._render_email(template_name, variables, include_text)
+
+    def _render_email(
+        self, template_name: str, variables: Dict[str, Any], include_text: bool
+    ) -> tuple[str, Optional[str]]:
+        """Render HTML and (optionally) text versions without caching."""
         html_path = f"{template_name}.html"
         html_content = self.render(html_path, variables)
 
         text_content = None
         if include_text:
-            text_path = f"{template_name}.txt"
-            try:
-                text_content = self.render(text_path, variables)
-            except Exception:
+            if template_name in self._txt_templates:
+                text_content = self.render(f"{template_name}.txt", variables)
+            else:
                 # If no .txt file exists, generate from HTML
                 text_content = html_to_text(html_content)
 
@@ -80,6 +217,7 @@ class TemplateLoader:
     def list_templates(self, category: Optional[str] = None) -> list[str]:
         """
         List available templates.
+        Listings are cached; call refresh() after adding or removing files.
 
         Args:
             category: Optional category to filter by (e.g., "welcome_series")
@@ -87,16 +225,12 @@ class TemplateLoader:
         Returns:
             List of template paths
         """
-        templates = []
-        search_dir = self.template_dir / category if category else self.template_dir
-
-        for file_path in search_dir.rglob("*.html"):
-            relative_path = file_path.relative_to(self.template_dir)
-            # Remove .html extension
-            template_name = str(relative_path).replace(".html", "")
-            templates.append(template_name)
+        # Copy, so callers can't modify the cached listing
+        return list(self._list_templates_cached(category))
 
-        return sorted(templates)
+    def _scan_templates(self, category: Optional[str]) -> tuple[str, ...]:
+        """Walk the template directory for list_templates()."""
+        return tuple(sorted(_walk_templates(self.template_dir, ".html", category)))
 
 
 # Singleton instance
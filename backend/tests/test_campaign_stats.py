@@ -0,0 +1,115 @@
+"""
+Tests for the campaign counters reported by CampaignManager.get_campaign_stats().
+"""
+import unittest
+
+from sqlalchemy import create_engine, func, update
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from vello.core.db import recompute_campaign_counters
+from vello.core.models import (
+    Base,
+    Campaign,
+    Delivery,
+    DeliveryStatus,
+    Recipient,
+    Response,
+    ResponseStatus,
+)
+from vello.email import EmailResult
+from vello.services import CampaignManager
+
+
+class FakeProvider:
+    """Email provider that fails every address starting with "fail"."""
+
+    def send_email(self, to, subject, body_text=None, body_html=None, **kwargs):
+        failed = to.startswith("fail")
+        return EmailResult(
+            success=not failed,
+            message_id=None if failed else f"<{to}>",
+            error="rejected" if failed else None,
+        )
+
+    def validate_config(self):
+        return True
+
+
+class CampaignStatsTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        self.session = Session(bind=engine, expire_on_commit=False)
+        self.addCleanup(engine.dispose)
+        self.addCleanup(self.session.close)
+        self.manager = CampaignManager(
+            email_provider=FakeProvider(), db_session=self.session
+        )
+
+    def _aggregate(self, model, status, campaign_id):
+        return (
+            self.session.query(func.count(model.id))
+            .join(Recipient)
+            .filter(Recipient.campaign_id == campaign_id, model.status == status)
+            .scalar()
+        )
+
+    def _run_campaign(self):
+        """Send one campaign with a failure, then record two responses."""
+        campaign = self.manager.create_campaign(
+            "stats",
+            [
+                {"position": 0, "delay_minutes": 0, "subject": "s0", "body_text": "a"},
+                {"position": 1, "delay_minutes": 0, "subject": "s1", "body_text": "b"},
+            ],
+        )
+        self.manager.add_recipients(
+            campaign.id, ["a@example.com", "b@example.com", "fail@example.com"]
+        )
+        self.manager.initialize_campaign_deliveries(campaign.id)
+        self.manager.process_pending_deliveries(campaign.id)
+        self.manager.handle_response("a@example.com", "Yes, I'm interested")
+        self.manager.handle_response("b@example.com", "Please unsubscribe me")
+        return campaign
+
+    def test_counters_match_aggregates(self):
+        campaign = self._run_campaign()
+        stats = self.manager.get_campaign_stats(campaign.id)
+        deliveries, responses = stats["deliveries"], stats["responses"]
+
+        self.assertEqual(
+            deliveries["sent"],
+            self._aggregate(Delivery, DeliveryStatus.SENT, campaign.id),
+        )
+        self.assertEqual(
+            deliveries["failed"],
+            self._aggregate(Delivery, DeliveryStatus.FAILED, campaign.id),
+        )
+        self.assertEqual(
+            responses["positive"],
+            self._aggregate(Response, ResponseStatus.POSITIVE, campaign.id),
+        )
+        self.assertEqual(deliveries["sent"], 2)
+        self.assertEqual(deliveries["failed"], 1)
+        self.assertEqual(responses["positive"], 1)
+
+    def test_recompute_restores_drifted_counters(self):
+        campaign = self._run_campaign()
+        expected = self.manager.get_campaign_stats(campaign.id)
+
+        self.session.execute(
+            update(Campaign).values(sent_count=0, failed_count=0, positive_count=0)
+        )
+        self.session.execute(recompute_campaign_counters(campaign.id))
+        self.session.commit()
+
+        self.assertEqual(self.manager.get_campaign_stats(campaign.id), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
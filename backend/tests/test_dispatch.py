@@ -0,0 +1,49 @@
+"""
+Tests for the background sender in vello.services.dispatch.
+"""
+import threading
+import time
+import unittest
+
+from vello.services.dispatch import dispatch
+
+
+class DispatchTest(unittest.TestCase):
+    def _assert_close_stops_sending(self, workers):
+        started = []
+        # Holds every send after the first until the caller has stopped reading
+        gate = threading.Event()
+
+        def send(item):
+            started.append(item)
+            if item:
+                gate.wait()
+            return item
+
+        results = dispatch(range(100), send, workers=workers)
+        self.assertEqual(next(results), (0, 0))
+        # close() waits for the sends in progress, so open the gate meanwhile
+        threading.Timer(0.05, gate.set).start()
+        results.close()
+
+        # Only sends already started (at most one per worker beyond the
+        # first) ran, and none start afterwards
+        count = len(started)
+        self.assertLessEqual(count, 1 + workers)
+        self.assertEqual(sorted(started), list(range(count)))
+        time.sleep(0.05)
+        self.assertEqual(len(started), count)
+
+    def test_close_stops_sending(self):
+        self._assert_close_stops_sending(workers=1)
+
+    def test_close_stops_pooled_sending(self):
+        self._assert_close_stops_sending(workers=4)
+
+    def test_results_in_item_order(self):
+        results = list(dispatch(range(50), lambda item: item * 2, workers=4))
+        self.assertEqual(results, [(item, item * 2) for item in range(50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
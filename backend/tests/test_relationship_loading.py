@@ -0,0 +1,94 @@
+"""
+Tests that CampaignManager reads only the relationships they eager-load.
+"""
+import unittest
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from vello.core.models import Base
+from vello.email import EmailResult
+from vello.services import CampaignManager
+
+
+class FakeProvider:
+    def send_email(self, to, subject, body_text=None, body_html=None, **kwargs):
+        return EmailResult(success=True, message_id=f"<{to}>")
+
+    def validate_config(self):
+        return True
+
+
+class RelationshipLoadingTest(unittest.TestCase):
+    def setUp(self):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        Base.metadata.create_all(bind=engine)
+        self.session = Session(bind=engine, expire_on_commit=False)
+        self.addCleanup(engine.dispose)
+        self.addCleanup(self.session.close)
+        self.manager = CampaignManager(
+            email_provider=FakeProvider(), db_session=self.session
+        )
+
+        self.campaign = self.manager.create_campaign(
+            "loading",
+            [{"position": 0, "delay_minutes": 0, "subject": "s", "body_text": "t"}],
+        )
+        self.manager.add_recipients(
+            self.campaign.id, [f"r{i}@example.com" for i in range(5)]
+        )
+        self.manager.initialize_campaign_deliveries(self.campaign.id)
+
+        self.statements = []
+        event.listen(
+            engine,
+            "before_cursor_execute",
+            lambda *args: self.statements.append(args[2]),
+        )
+
+    def test_pending_deliveries_raise_on_unloaded_relationships(self):
+        rendered = []
+        build = self.manager._build_campaign_email
+
+        def capture(step, recipient):
+            rendered.append((step, recipient))
+            return build(step, recipient)
+
+        self.manager._build_campaign_email = capture
+        self.assertEqual(self.manager.process_pending_deliveries(self.campaign.id), 5)
+
+        self.assertEqual(len(rendered), 5)
+        for step, recipient in rendered:
+            # Loaded up front for every row
+            self.assertEqual(step.subject, "s")
+            self.assertTrue(recipient.email.endswith("@example.com"))
+            # Anything else is raiseload("*"), not a silent per-row query
+            with self.assertRaises(InvalidRequestError):
+                recipient.deliveries
+            with self.assertRaises(InvalidRequestError):
+                step.campaign
+
+    def test_stats_issue_a_fixed_number_of_queries(self):
+        self.manager.process_pending_deliveries(self.campaign.id)
+        self.statements.clear()
+        self.manager.get_campaign_stats(self.campaign.id)
+        few = len(self.statements)
+
+        self.manager.add_recipients(
+            self.campaign.id, [f"more{i}@example.com" for i in range(20)]
+        )
+        self.manager.initialize_campaign_deliveries(self.campaign.id)
+        self.manager.process_pending_deliveries(self.campaign.id)
+        self.statements.clear()
+        self.manager.get_campaign_stats(self.campaign.id)
+        self.assertEqual(len(self.statements), few)
+
+
+if __name__ == "__main__":
+    unittest.main()
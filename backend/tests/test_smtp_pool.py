@@ -0,0 +1,81 @@
+"""
+Tests for the SMTP connection pool.
+"""
+import smtplib
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from vello.email.smtp_provider import SMTPProvider
+
+
+class FakeSMTP:
+    """Minimal stand-in for smtplib.SMTP that records open connections."""
+
+    lock = threading.Lock()
+    open_count = 0
+    max_open = 0
+
+    def __init__(self, host, port, *args, **kwargs):
+        with FakeSMTP.lock:
+            FakeSMTP.open_count += 1
+            FakeSMTP.max_open = max(FakeSMTP.max_open, FakeSMTP.open_count)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def noop(self):
+        return (250, b"ok")
+
+    def rset(self):
+        pass
+
+    def send_message(self, msg, *args, **kwargs):
+        time.sleep(0.001)
+
+    def quit(self):
+        with FakeSMTP.lock:
+            FakeSMTP.open_count -= 1
+
+    close = quit
+
+
+class SMTPConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        FakeSMTP.open_count = FakeSMTP.max_open = 0
+        patcher = mock.patch.object(smtplib, "SMTP", FakeSMTP)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_discarded_connections_wake_waiting_callers(self):
+        """More callers than pool_size with connections recycled mid-run."""
+        provider = SMTPProvider(
+            "smtp.example.com", 587, "user", "pw",
+            pool_size=2, max_messages_per_conn=3,
+        )
+
+        def send_email(i):
+            return provider.send_email(
+                to=f"r{i}@example.com", subject="s", body_text="t"
+            )
+
+        # Don't wait on worker threads: a lost wakeup leaves them blocked forever
+        executor = ThreadPoolExecutor(5)
+        try:
+            results = list(executor.map(send_email, range(20), timeout=10))
+        finally:
+            executor.shutdown(wait=False)
+
+        self.assertTrue(all(result.success for result in results))
+        self.assertLessEqual(FakeSMTP.max_open, 2)
+        provider.close()
+        self.assertEqual(FakeSMTP.open_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()